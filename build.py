@@ -44,7 +44,19 @@ def main():
     step("Generating version_info.txt")
     run(f'"{sys.executable}" version_info.py', cwd=ROOT)
 
-    # 2. Build .exe with PyInstaller
+    # 2. PCM copy of the click sound (ui/sounds.py plays it via QSoundEffect)
+    step("Preparing click.wav")
+    sounds = os.path.join(ROOT, "assets", "sounds")
+    wav = os.path.join(sounds, "click.wav")
+    if os.path.isfile(wav):
+        print("  click.wav already present")
+    elif shutil.which("ffmpeg"):
+        run(f'ffmpeg -y -loglevel error -i "{os.path.join(sounds, "click.mp3")}" '
+            f'-ac 1 -ar 44100 -sample_fmt s16 "{wav}"')
+    else:
+        print("  WARNING: ffmpeg not found, clicks will fall back to QMediaPlayer (mp3)")
+
+    # 3. Build .exe with PyInstaller
     step("Building Mary Jane.exe with PyInstaller")
     run(f'"{sys.executable}" -m PyInstaller mj_port.spec --noconfirm', cwd=ROOT)
 
@@ -55,7 +67,7 @@ def main():
     size_mb = os.path.getsize(exe_path) / (1024 * 1024)
     print(f"  Mary Jane.exe: {size_mb:.1f} MB")
 
-    # 3. Copy Tesseract
+    # 4. Copy Tesseract
     step("Copying Tesseract OCR")
     if not os.path.isdir(TESS_SRC):
         print(f"ERROR: Tesseract not found at {TESS_SRC}")
@@ -93,7 +105,7 @@ def main():
     ) / (1024 * 1024)
     print(f"  Tesseract total: {tess_size:.1f} MB")
 
-    # 4. Copy ViGEmBus installer
+    # 5. Copy ViGEmBus installer
     step("Copying ViGEmBus driver installer")
     vigem_dest = os.path.join(DIST, "vigem")
     os.makedirs(vigem_dest, exist_ok=True)
@@ -109,7 +121,7 @@ def main():
     except ImportError:
         print("  WARNING: vgamepad not installed, skipping ViGEmBus")
 
-    # 5. Build installer
+    # 6. Build installer
     step("Building installer with Inno Setup")
     iscc = find_iscc()
     if iscc is None:
@@ -19,9 +19,15 @@ def is_game_running():
     return hwnd != 0
 
 
+_game_hwnd = 0  # last FindWindowW hit, reused by get_game_rect while the window lives
+
+
 def get_game_rect():
+    global _game_hwnd
     import win32gui
-    hwnd = user32.FindWindowW(None, GAME_WINDOW_TITLE)
+    hwnd = _game_hwnd
+    if not (hwnd and user32.IsWindow(hwnd)):
+        hwnd = _game_hwnd = user32.FindWindowW(None, GAME_WINDOW_TITLE)
     if not hwnd:
         return None
     left, top, right, bottom = win32gui.GetWindowRect(hwnd)
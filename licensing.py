@@ -1,11 +1,13 @@
 """Hardware-bound license activation via Gumroad API."""
 
+import copy
 import hashlib
 import json
 import logging
 import os
 import subprocess
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
@@ -87,17 +89,41 @@ def _validate_online(license_key: str) -> dict | None:
     return None
 
 
-def _load_config() -> dict:
+# In-memory copy of config.json; re-parsed only when the file's mtime changes.
+_config_cache: dict | None = None
+_config_mtime: int | None = None
+_config_lock = threading.Lock()
+
+
+def _config_stat_mtime() -> int | None:
     try:
-        with open(_config_path(), "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+        return os.stat(_config_path()).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_config() -> dict:
+    """Return a private copy of the config (callers mutate and _save_config it)."""
+    global _config_cache, _config_mtime
+    with _config_lock:
+        mtime = _config_stat_mtime()
+        if _config_cache is None or mtime != _config_mtime:
+            try:
+                with open(_config_path(), "r", encoding="utf-8") as f:
+                    _config_cache = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                _config_cache = {}
+            _config_mtime = mtime
+        return copy.deepcopy(_config_cache)
 
 
 def _save_config(data: dict):
-    with open(_config_path(), "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False)
+    global _config_cache, _config_mtime
+    with _config_lock:
+        with open(_config_path(), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        _config_cache = copy.deepcopy(data)
+        _config_mtime = _config_stat_mtime()
 
 
 def check_activation() -> bool:
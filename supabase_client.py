@@ -1,5 +1,6 @@
 """Direct Supabase REST client for items & prices (no server needed)."""
 
+import json
 import logging
 
 import aiohttp
@@ -35,8 +36,8 @@ class SupabaseClient:
                 if resp.status != 200:
                     log.error("Supabase get_items: %d", resp.status)
                     return []
-                return await resp.json()
-        except aiohttp.ClientError as e:
+                return json.loads(await resp.read())
+        except (aiohttp.ClientError, json.JSONDecodeError) as e:
             log.error("Supabase get_items error: %s", e)
             return []
 
@@ -49,8 +50,8 @@ class SupabaseClient:
                 if resp.status != 200:
                     log.error("Supabase get_price_summary: %d", resp.status)
                     return []
-                return await resp.json()
-        except aiohttp.ClientError as e:
+                return json.loads(await resp.read())
+        except (aiohttp.ClientError, json.JSONDecodeError) as e:
             log.error("Supabase get_price_summary error: %s", e)
             return []
 
@@ -9,6 +9,7 @@ class FooterBar(QWidget):
     _BG   = QColor(20, 20, 24, 230)
     _FILL = QColor(80, 200, 80, 40)
     _BORDER_TOP = QColor(255, 255, 255, 15)
+    _BORDER_PEN = QPen(_BORDER_TOP, 1)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -33,7 +34,7 @@ class FooterBar(QWidget):
             p.setBrush(self._FILL)
             p.drawRect(0, 0, bw, h)
 
-        p.setPen(QPen(self._BORDER_TOP, 1))
+        p.setPen(self._BORDER_PEN)
         p.drawLine(0, 0, w, 0)
 
         p.end()
@@ -1,20 +1,25 @@
 """Items catalog window."""
 
 import asyncio
-import json
 import logging
 import os
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QLineEdit, QComboBox, QLabel, QPushButton, QAbstractItemView,
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt5.QtGui import QColor, QPixmap, QIcon, QImage
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QSize, QBuffer, QByteArray, QAbstractTableModel, QModelIndex,
+)
+from PyQt5.QtGui import QColor, QPixmap, QImage, QImageReader
 
 import aiohttp
 
-from licensing import _config_path
+from licensing import _load_config, _save_config
+from ui.sounds import add_click_sound
 from ui.styles import app_font, _font_families
 from ui.widgets import IconWidget
 
@@ -22,23 +27,13 @@ log = logging.getLogger(__name__)
 
 
 def _load_favorites() -> set[int]:
-    try:
-        with open(_config_path(), "r", encoding="utf-8") as f:
-            return set(json.load(f).get("favorites", []))
-    except (FileNotFoundError, json.JSONDecodeError):
-        return set()
+    return set(_load_config().get("favorites", []))
 
 
 def _save_favorites(ids: set[int]):
-    path = _config_path()
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        cfg = {}
+    cfg = _load_config()
     cfg["favorites"] = sorted(ids)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, ensure_ascii=False)
+    _save_config(cfg)
 
 _CATEGORY_LABELS = {
     "food": "Продукты",
@@ -67,6 +62,7 @@ _CATEGORY_LABELS = {
 }
 
 _IMG_SIZE = 40
+_IMG_CACHE_MAX = 1024  # ~6.5 MB of 40x40 RGBA thumbnails
 _PLACEHOLDER = None
 
 
@@ -78,6 +74,22 @@ def _placeholder() -> QPixmap:
     return _PLACEHOLDER
 
 
+def _decode_thumb(data: bytes) -> QImage:
+    """Decode straight to thumbnail size (aspect kept); null QImage on failure."""
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    reader = QImageReader(buf)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(_IMG_SIZE, _IMG_SIZE, Qt.KeepAspectRatio))
+    img = reader.read()
+    if not img.isNull() and (img.width() > _IMG_SIZE or img.height() > _IMG_SIZE):
+        # formats that ignore setScaledSize
+        img = img.scaled(_IMG_SIZE, _IMG_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return img
+
+
 def _ff():
     return f"font-family: '{_font_families['app']}';" if _font_families.get("app") else ""
 
@@ -109,12 +121,12 @@ _WINDOW_CSS = """
         outline: none; font-size: 22px;
         text-align: left;
     }
-    QTableWidget {
+    QTableView {
         background: rgb(28, 28, 32); color: rgb(240, 240, 240);
         border: none; gridline-color: rgba(255, 255, 255, 12);
         selection-background-color: rgb(44, 44, 52);
     }
-    QTableWidget::item { padding: 2px 6px; }
+    QTableView::item { padding: 2px 6px; }
     QHeaderView::section {
         background: rgb(32, 32, 38); color: rgb(180, 180, 180);
         border: none; border-bottom: 1px solid rgba(255, 255, 255, 20);
@@ -132,18 +144,138 @@ _WINDOW_CSS = """
 """
 
 
+@dataclass(slots=True)
+class _ItemRow:
+    """One catalog item with its display and filter/sort strings worked out up front."""
+    id: int
+    name: str
+    category: str
+    cat_label: str
+    image_url: str | None
+    name_key: str  # lowercased name, for search and sorting
+    cat_key: str   # lowercased raw category, for sorting
+
+    @classmethod
+    def from_item(cls, it: dict) -> "_ItemRow":
+        name = it.get("name") or ""
+        cat = it.get("category") or ""
+        return cls(it.get("id", 0), name, cat, _CATEGORY_LABELS.get(cat, cat),
+                   it.get("image_url"), name.lower(), cat.lower())
+
+
+_STAR_ON = QColor(255, 200, 60)
+_STAR_OFF = QColor(80, 80, 80)
+_CAT_FG = QColor(160, 160, 160)
+_ALIGN_LEFT = int(Qt.AlignLeft | Qt.AlignVCenter)
+_ALIGN_CENTER = int(Qt.AlignCenter)
+
+
+class _ItemsModel(QAbstractTableModel):
+    """Filtered item rows; the view asks only for the cells it is painting."""
+
+    def __init__(self, cached_image, request_image, favorites: set[int], parent=None):
+        super().__init__(parent)
+        self._cached_image = cached_image
+        self._request_image = request_image
+        self._favorites = favorites
+        self._items: list[_ItemRow] = []
+        self._row_of: dict[int, int] = {}  # item_id -> row
+        self._headers = ["", "", "", ""]
+        self._font = app_font(22)
+
+    def set_items(self, items: list[_ItemRow]):
+        old = self._items
+        if len(items) == len(old) and all(map(operator.is_, items, old)):
+            return  # same rows in the same order: keep selection and scroll
+        row_of = {it.id: row for row, it in enumerate(items)}
+        if len(items) == len(old) and row_of.keys() == self._row_of.keys():
+            # same rows, new order (sort click): move persistent indexes, no reset
+            self.layoutAboutToBeChanged.emit()
+            for idx in self.persistentIndexList():
+                row = row_of[self.item_id(idx.row())]
+                self.changePersistentIndex(idx, self.index(row, idx.column()))
+            self._items = items
+            self._row_of = row_of
+            self.layoutChanged.emit()
+            return
+        self.beginResetModel()
+        self._items = items
+        self._row_of = row_of
+        self.endResetModel()
+
+    def set_headers(self, labels: list[str]):
+        self._headers = labels
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(labels) - 1)
+
+    def item_id(self, row: int) -> int:
+        return self._items[row].id
+
+    def refresh_cell(self, item_id: int, col: int):
+        row = self._row_of.get(item_id)
+        if row is not None:
+            idx = self.index(row, col)
+            self.dataChanged.emit(idx, idx)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 4
+
+    def flags(self, index):
+        if index.column() in (0, 3):
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        it = self._items[index.row()]
+        col = index.column()
+        if col == 0:
+            if role == Qt.DecorationRole:
+                pix = self._cached_image(it.id)
+                if pix is None:
+                    if it.image_url:
+                        self._request_image(it.id, it.image_url)
+                    return _placeholder()
+                return pix
+            return None
+        if role == Qt.DisplayRole:
+            if col == 1:
+                return it.name
+            if col == 2:
+                return it.cat_label
+            return "\u2605" if it.id in self._favorites else "\u2606"
+        if role == Qt.FontRole:
+            return self._font
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_CENTER if col == 3 else _ALIGN_LEFT
+        if role == Qt.ForegroundRole:
+            if col == 2:
+                return _CAT_FG
+            if col == 3:
+                return _STAR_ON if it.id in self._favorites else _STAR_OFF
+        return None
+
+
 class ItemsWindow(QWidget):
-    _sig_items_loaded = pyqtSignal(list)
-    _sig_image_ready = pyqtSignal(int, QPixmap)  # item_id, pixmap
+    _sig_items_loaded = pyqtSignal(list, list)  # rows, sorted categories
+    _sig_image_ready = pyqtSignal(int, QImage)  # item_id, decoded + scaled thumbnail
 
     def __init__(self, state, parent=None):
         super().__init__(parent)
         self._state = state
-        self._all_items: list[dict] = []
+        self._all_items: list[_ItemRow] = []
+        self._sorted: dict[tuple[int, bool], list[_ItemRow]] = {}  # (sort col, asc) -> catalog order
         self._categories: list[str] = []
         self._sort_col = 1  # name
         self._sort_asc = True
-        self._image_cache: dict[int, QPixmap] = {}
+        # LRU of thumbnails keyed by (item_id, size)
+        self._image_cache: OrderedDict[tuple[int, int], QPixmap] = OrderedDict()
         self._favorites: set[int] = _load_favorites()
         self._show_favorites = False
         self._drag_pos = None
@@ -156,13 +288,28 @@ class ItemsWindow(QWidget):
         self._sig_items_loaded.connect(self._on_items_loaded)
         self._sig_image_ready.connect(self._on_image_ready)
 
-        self._build_ui()
-
-        self._search_timer = QTimer()
+        # search debounce: a burst of keystrokes re-filters once
+        self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
-        self._search_timer.setInterval(300)
+        self._search_timer.setInterval(150)
         self._search_timer.timeout.connect(self._apply_filters)
 
+        # favourites are written to the config once a burst of star clicks settles
+        self._fav_save_timer = QTimer(self)
+        self._fav_save_timer.setSingleShot(True)
+        self._fav_save_timer.setInterval(500)
+        self._fav_save_timer.timeout.connect(self._flush_favorites)
+
+        # thumbnails are fetched for rows the view actually paints, batched per 30 ms
+        self._img_pending: list[tuple[int, str]] = []
+        self._img_requested: set[int] = set()  # failed ids stay here: no refetch per repaint
+        self._img_batch_timer = QTimer(self)
+        self._img_batch_timer.setSingleShot(True)
+        self._img_batch_timer.setInterval(30)
+        self._img_batch_timer.timeout.connect(self._flush_image_requests)
+
+        self._build_ui()
+
     # ── UI ────────────────────────────────────────────────
 
     def _build_ui(self):
@@ -196,6 +343,7 @@ class ItemsWindow(QWidget):
         cl.setContentsMargins(0, 0, 0, 0)
         cl.addWidget(close_icon)
         close_btn.clicked.connect(self.close)
+        add_click_sound(close_btn)
         tb_lay.addWidget(close_btn)
 
         root.addWidget(title_bar)
@@ -210,7 +358,8 @@ class ItemsWindow(QWidget):
         self._search_input = QLineEdit()
         self._search_input.setPlaceholderText("Поиск по названию…")
         self._search_input.setFont(app_font(22))
-        self._search_input.textChanged.connect(lambda: self._search_timer.start())
+        self._search_input.textChanged.connect(self._search_timer.start)
+        add_click_sound(self._search_input)
         tl.addWidget(self._search_input, 1)
 
         self._cat_combo = QComboBox()
@@ -231,6 +380,7 @@ class ItemsWindow(QWidget):
         )
         self._fav_btn.setToolTip("Избранное")
         self._fav_btn.clicked.connect(self._toggle_favorites)
+        add_click_sound(self._fav_btn)
         tl.addWidget(self._fav_btn)
 
         root.addWidget(toolbar)
@@ -243,9 +393,10 @@ class ItemsWindow(QWidget):
         )
         root.addWidget(self._count_label)
 
-        # table
-        self._table = QTableWidget()
-        self._table.setColumnCount(4)
+        # table; cells come from the model on demand, nothing is built per row
+        self._model = _ItemsModel(self._cached_image, self._request_image, self._favorites, self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.verticalHeader().setVisible(False)
         self._table.setShowGrid(False)
         self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -263,7 +414,7 @@ class ItemsWindow(QWidget):
         self._table.setColumnWidth(3, 36)
         hdr.sectionClicked.connect(self._on_header_clicked)
         self._update_header_labels()
-        self._table.cellClicked.connect(self._on_cell_clicked)
+        self._table.clicked.connect(self._on_cell_clicked)
 
         self._table.verticalHeader().setDefaultSectionSize(_IMG_SIZE + 6)
 
@@ -282,13 +433,15 @@ class ItemsWindow(QWidget):
 
     async def _fetch_all(self, sb):
         items = await sb.get_items()
-        self._sig_items_loaded.emit(items)
+        # row prep runs here on the loop thread; the GUI thread only gets finished rows
+        rows = [_ItemRow.from_item(it) for it in items]
+        cats = sorted({r.category for r in rows if r.category},
+                      key=lambda c: _CATEGORY_LABELS.get(c, c))
+        self._sig_items_loaded.emit(rows, cats)
 
-    def _on_items_loaded(self, items: list):
+    def _on_items_loaded(self, items: list, cats: list):
         self._all_items = items
-
-        cats = sorted({it.get("category", "") for it in items if it.get("category")},
-                       key=lambda c: _CATEGORY_LABELS.get(c, c))
+        self._sorted = {}
         self._categories = cats
         self._cat_combo.blockSignals(True)
         self._cat_combo.clear()
@@ -298,7 +451,6 @@ class ItemsWindow(QWidget):
         self._cat_combo.blockSignals(False)
 
         self._apply_filters()
-        self._load_images(items)
 
     # ── Filtering / sorting ───────────────────────────────
 
@@ -313,92 +465,60 @@ class ItemsWindow(QWidget):
         )
         self._apply_filters()
 
-    def _on_cell_clicked(self, row: int, col: int):
-        if col != 3:
-            return
-        name_item = self._table.item(row, 1)
-        if not name_item:
+    def _on_cell_clicked(self, index: QModelIndex):
+        if index.column() != 3:
             return
-        item_id = name_item.data(Qt.UserRole)
+        item_id = self._model.item_id(index.row())
         if item_id in self._favorites:
             self._favorites.discard(item_id)
         else:
             self._favorites.add(item_id)
-        _save_favorites(self._favorites)
-        star = self._table.item(row, 3)
-        if star:
-            is_fav = item_id in self._favorites
-            star.setText("\u2605" if is_fav else "\u2606")
-            star.setForeground(QColor(255, 200, 60) if is_fav else QColor(80, 80, 80))
+        self._fav_save_timer.start()
+        self._model.refresh_cell(item_id, 3)
         if self._show_favorites:
             self._apply_filters()
 
-    def _filtered_items(self) -> list[dict]:
-        items = self._all_items
+    def _flush_favorites(self):
+        self._fav_save_timer.stop()
+        _save_favorites(self._favorites)
 
-        if self._show_favorites:
-            items = [it for it in items if it.get("id", 0) in self._favorites]
+    def _sorted_items(self) -> list[_ItemRow]:
+        """Whole catalog in the current sort order, sorted once per (column, direction)."""
+        k = (self._sort_col, self._sort_asc)
+        items = self._sorted.get(k)
+        if items is None:
+            key = operator.attrgetter("name_key" if self._sort_col == 1 else "cat_key")
+            items = self._sorted[k] = sorted(self._all_items, key=key, reverse=not self._sort_asc)
+        return items
 
+    def _filtered_items(self) -> list[_ItemRow]:
+        # filters keep order, and the sort is stable, so filtering the sorted
+        # catalog gives the same rows as sorting the filtered subset
+        items = self._sorted_items()
         search = self._search_input.text().strip().lower()
         if search:
-            items = [it for it in items if search in it.get("name", "").lower()]
+            items = [it for it in items if search in it.name_key]
+
+        if self._show_favorites:
+            items = [it for it in items if it.id in self._favorites]
 
         cat_idx = self._cat_combo.currentIndex()
         if cat_idx > 0:
             cat = self._categories[cat_idx - 1]
-            items = [it for it in items if it.get("category") == cat]
-
-        key = "name" if self._sort_col == 1 else "category"
-        items = sorted(items, key=lambda it: (it.get(key) or "").lower(), reverse=not self._sort_asc)
+            items = [it for it in items if it.category == cat]
         return items
 
     def _apply_filters(self):
         items = self._filtered_items()
         self._count_label.setText(f"  {len(items)} из {len(self._all_items)}")
-        self._populate_table(items)
-
-    def _populate_table(self, items: list[dict]):
-        self._table.setRowCount(len(items))
-        for row, it in enumerate(items):
-            item_id = it.get("id", 0)
-
-            # icon column
-            icon_item = QTableWidgetItem()
-            pix = self._image_cache.get(item_id, _placeholder())
-            icon_item.setIcon(QIcon(pix))
-            icon_item.setFlags(Qt.ItemIsEnabled)
-            self._table.setItem(row, 0, icon_item)
-
-            # name
-            name_item = QTableWidgetItem(it.get("name", ""))
-            name_item.setFont(app_font(22))
-            name_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            name_item.setData(Qt.UserRole, item_id)
-            self._table.setItem(row, 1, name_item)
-
-            # category
-            raw_cat = it.get("category", "")
-            cat_item = QTableWidgetItem(_CATEGORY_LABELS.get(raw_cat, raw_cat))
-            cat_item.setFont(app_font(22))
-            cat_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            cat_item.setForeground(QColor(160, 160, 160))
-            self._table.setItem(row, 2, cat_item)
-
-            # favorite star
-            is_fav = item_id in self._favorites
-            star_item = QTableWidgetItem("\u2605" if is_fav else "\u2606")
-            star_item.setFont(app_font(22))
-            star_item.setTextAlignment(Qt.AlignCenter | Qt.AlignVCenter)
-            star_item.setForeground(QColor(255, 200, 60) if is_fav else QColor(80, 80, 80))
-            star_item.setFlags(Qt.ItemIsEnabled)
-            self._table.setItem(row, 3, star_item)
+        self._model.set_items(items)
 
     def _update_header_labels(self):
         labels = ["", "Название", "Категория", ""]
         for i in (1, 2):
             if i == self._sort_col:
                 labels[i] += "  \u25B2" if self._sort_asc else "  \u25BC"
-        self._table.setHorizontalHeaderLabels(labels)
+        self._model.set_headers(labels)
 
     def _on_header_clicked(self, col: int):
         if col == 0:
@@ -413,15 +533,21 @@ class ItemsWindow(QWidget):
 
     # ── Image loading ─────────────────────────────────────
 
-    def _load_images(self, items: list[dict]):
+    def _request_image(self, item_id: int, url: str):
+        if item_id in self._img_requested:
+            return
+        self._img_requested.add(item_id)
+        self._img_pending.append((item_id, url))
+        if not self._img_batch_timer.isActive():
+            self._img_batch_timer.start()
+
+    def _flush_image_requests(self):
+        urls, self._img_pending = self._img_pending, []
         loop = self._state.loop
         if not loop:
+            # no loop yet: forget them so the next paint asks again
+            self._img_requested.difference_update(iid for iid, _ in urls)
             return
-        urls = []
-        for it in items:
-            url = it.get("image_url")
-            if url:
-                urls.append((it["id"], url))
         if urls:
             asyncio.run_coroutine_threadsafe(self._download_images(urls), loop)
 
@@ -434,12 +560,10 @@ class ItemsWindow(QWidget):
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
                         if resp.status == 200:
                             data = await resp.read()
-                            img = QImage()
-                            if img.loadFromData(data):
-                                pix = QPixmap.fromImage(img).scaled(
-                                    _IMG_SIZE, _IMG_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation,
-                                )
-                                self._sig_image_ready.emit(item_id, pix)
+                            # decode as QImage here; QPixmap is GUI-thread only
+                            img = _decode_thumb(data)
+                            if not img.isNull():
+                                self._sig_image_ready.emit(item_id, img)
                 except Exception:
                     pass
 
@@ -447,25 +571,40 @@ class ItemsWindow(QWidget):
             tasks = [_fetch_one(session, iid, u) for iid, u in urls]
             await asyncio.gather(*tasks)
 
-    def _on_image_ready(self, item_id: int, pix: QPixmap):
-        self._image_cache[item_id] = pix
-        # update visible rows that match this item_id
-        for row in range(self._table.rowCount()):
-            name_item = self._table.item(row, 1)
-            if name_item and name_item.data(Qt.UserRole) == item_id:
-                self._table.item(row, 0).setIcon(QIcon(pix))
-                break
+    def _cached_image(self, item_id: int) -> QPixmap | None:
+        key = (item_id, _IMG_SIZE)
+        pix = self._image_cache.get(key)
+        if pix is not None:
+            self._image_cache.move_to_end(key)
+        return pix
+
+    def _on_image_ready(self, item_id: int, img: QImage):
+        self._img_requested.discard(item_id)  # evicted later -> may be fetched again
+        pix = QPixmap.fromImage(img)
+        cache = self._image_cache
+        cache[(item_id, _IMG_SIZE)] = pix
+        cache.move_to_end((item_id, _IMG_SIZE))
+        while len(cache) > _IMG_CACHE_MAX:
+            cache.popitem(last=False)
+        self._model.refresh_cell(item_id, 0)
+
+    def closeEvent(self, ev):
+        if self._fav_save_timer.isActive():
+            self._flush_favorites()
+        super().closeEvent(ev)
 
     # ── Dragging ──────────────────────────────────────────
 
     def mousePressEvent(self, ev):
         if ev.button() == Qt.LeftButton and ev.pos().y() < 36:
-            self._drag_pos = ev.globalPos() - self.frameGeometry().topLeft()
+            # plain-int offset from the window's top-left (x()/y() include the frame)
+            self._drag_pos = (ev.globalX() - self.x(), ev.globalY() - self.y())
             ev.accept()
 
     def mouseMoveEvent(self, ev):
-        if self._drag_pos and ev.buttons() == Qt.LeftButton:
-            self.move(ev.globalPos() - self._drag_pos)
+        if self._drag_pos is not None and ev.buttons() == Qt.LeftButton:
+            dx, dy = self._drag_pos
+            self.move(ev.globalX() - dx, ev.globalY() - dy)
             ev.accept()
 
     def mouseReleaseEvent(self, _ev):
@@ -4,7 +4,7 @@ import ctypes
 
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
 
 _GWL_EXSTYLE      = -20
 _WS_EX_LAYERED    = 0x80000
@@ -14,10 +14,35 @@ _CLICK_THROUGH    = _WS_EX_LAYERED | _WS_EX_TRANSPARENT | _WS_EX_TOOLWINDOW
 
 
 class OverlayWindow(QWidget):
+    # fishing
+    _PEN_BAR        = QPen(QColor(255, 220, 50), 1)
+    _BRUSH_BAR      = QBrush(QColor(255, 220, 50, 20))
+    _PEN_GREEN      = QPen(QColor(80, 255, 80), 2)
+    _BRUSH_GREEN    = QBrush(QColor(80, 255, 80, 40))
+    _PEN_BOUNDS     = QPen(QColor(255, 255, 255, 180), 1)
+    _BRUSH_BOUNDS   = QBrush(QColor(255, 255, 255, 30))
+    _PEN_PRED       = QPen(QColor(255, 60, 60), 3)
+    _PEN_BUBBLES    = QPen(QColor(255, 165, 0), 3)
+    _BRUSH_BUBBLES  = QBrush(QColor(255, 165, 0, 30))
+    _PEN_BOBBER     = QPen(QColor(255, 80, 255), 2)
+    _BRUSH_BOBBER   = QBrush(QColor(255, 80, 255, 20))
+    _PEN_TAKE       = QPen(QColor(255, 220, 50), 2)
+    _BRUSH_TAKE     = QBrush(QColor(255, 220, 50, 30))
+    # toilet
+    _PEN_TOILET       = QPen(QColor(0, 220, 255), 2)
+    _BRUSH_TOILET     = QBrush(QColor(0, 220, 255, 15))
+    _PEN_TOILET_INNER = QPen(QColor(0, 220, 255, 100), 1, Qt.DashLine)
+    _PEN_JORSHIK      = QPen(QColor(80, 255, 80), 2)
+    _PEN_PATH         = QPen(QColor(255, 255, 255, 40), 1)
+    _BRUSH_CURSOR     = QBrush(QColor(255, 140, 0))
+    _PEN_CURSOR_RING  = QPen(QColor(255, 140, 0, 120), 2)
+
     def __init__(self, state):
         super().__init__()
         self._state = state
         self._snap = None
+        self._geo = None        # last (x, y, w, h) passed to setGeometry
+        self._visible = False   # mirrors isVisible() without a Qt call per tick
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_ShowWithoutActivating)
@@ -38,12 +63,15 @@ class OverlayWindow(QWidget):
         show_toilet = gr and s.toilet_active and s.toilet_step in ("search", "scrub", "done")
 
         if show_fish2 or show_toilet:
-            gx, gy, gw, gh = gr
-            geo = self.geometry()
-            if geo.x() != gx or geo.y() != gy or geo.width() != gw or geo.height() != gh:
-                self.setGeometry(gx, gy, gw, gh)
-            if not self.isVisible():
+            full = False
+            if gr != self._geo:
+                self._geo = gr
+                self.setGeometry(*gr)
+                full = True
+            if not self._visible:
+                self._visible = True
                 self.show()
+                full = True
             snap = (gr, s.fishing2_step, s.fishing2_debug,
                     s.fishing2_bar_rect,
                     s.fishing2_green_zone,
@@ -53,11 +81,12 @@ class OverlayWindow(QWidget):
                     s.fishing2_bubbles, s.fishing2_camera_dir,
                     s.fishing2_take_icon,
                     s.toilet_step, s.toilet_rect, s.toilet_jorshik,
-                    s.toilet_cursor)
-            if snap != self._snap:
+                    s.toilet_cursor, s.toilet_path)
+            if snap != self._snap or full:
                 self._snap = snap
                 self.update()
-        elif self.isVisible():
+        elif self._visible:
+            self._visible = False
             self.hide()
             self._snap = None
 
@@ -75,8 +104,8 @@ class OverlayWindow(QWidget):
 
         if step == "cast" and s.fishing2_bar_rect:
             bx, by, bw, bh = s.fishing2_bar_rect
-            p.setPen(QPen(QColor(255, 220, 50), 1))
-            p.setBrush(QColor(255, 220, 50, 20))
+            p.setPen(self._PEN_BAR)
+            p.setBrush(self._BRUSH_BAR)
             p.drawRect(bx, by - 2, bw, bh + 4)
 
         if step not in ("cast", "strike", "reel", "end"):
@@ -88,8 +117,8 @@ class OverlayWindow(QWidget):
 
             if gz:
                 gx, gy, gw, gh = gz
-                p.setPen(QPen(QColor(80, 255, 80), 2))
-                p.setBrush(QColor(80, 255, 80, 40))
+                p.setPen(self._PEN_GREEN)
+                p.setBrush(self._BRUSH_GREEN)
                 p.drawRect(gx, gy, gw, gh)
 
             ref_y = gz[1] if gz else (bar[1] if bar else None)
@@ -98,13 +127,13 @@ class OverlayWindow(QWidget):
             sb = s.fishing2_slider_bounds
             if sb and ref_y is not None:
                 sl, sr = sb
-                p.setPen(QPen(QColor(255, 255, 255, 180), 1))
-                p.setBrush(QColor(255, 255, 255, 30))
+                p.setPen(self._PEN_BOUNDS)
+                p.setBrush(self._BRUSH_BOUNDS)
                 p.drawRect(sl, ref_y - 4, sr - sl, ref_h + 8)
 
             px = s.fishing2_pred_x
             if px is not None and ref_y is not None:
-                p.setPen(QPen(QColor(255, 60, 60), 3))
+                p.setPen(self._PEN_PRED)
                 p.drawLine(px, ref_y - 10, px, ref_y + ref_h + 10)
 
         elif step == "strike":
@@ -112,19 +141,19 @@ class OverlayWindow(QWidget):
             if bob:
                 bx, by, bw, bh = bob
                 if s.fishing2_bubbles:
-                    p.setPen(QPen(QColor(255, 165, 0), 3))
-                    p.setBrush(QColor(255, 165, 0, 30))
+                    p.setPen(self._PEN_BUBBLES)
+                    p.setBrush(self._BRUSH_BUBBLES)
                 else:
-                    p.setPen(QPen(QColor(255, 80, 255), 2))
-                    p.setBrush(QColor(255, 80, 255, 20))
+                    p.setPen(self._PEN_BOBBER)
+                    p.setBrush(self._BRUSH_BOBBER)
                 p.drawRect(bx, by, bw, bh)
 
         elif step == "end":
             tk = s.fishing2_take_icon
             if tk:
                 tx, ty, tw, th = tk
-                p.setPen(QPen(QColor(255, 220, 50), 2))
-                p.setBrush(QColor(255, 220, 50, 30))
+                p.setPen(self._PEN_TAKE)
+                p.setBrush(self._BRUSH_TAKE)
                 p.drawRect(tx, ty, tw, th)
 
     def _paint_toilet(self, p: QPainter):
@@ -136,16 +165,15 @@ class OverlayWindow(QWidget):
         tr = s.toilet_rect
         if tr:
             tx, ty, tw, th = tr
-            p.setPen(QPen(QColor(0, 220, 255), 2))
-            p.setBrush(QColor(0, 220, 255, 15))
+            p.setPen(self._PEN_TOILET)
+            p.setBrush(self._BRUSH_TOILET)
             p.drawRect(tx, ty, tw, th)
 
             # Inner cleaning area — dashed
             mx = int(tw * 0.18)
             mt = int(th * 0.18)
             mb = int(th * 0.12)
-            pen = QPen(QColor(0, 220, 255, 100), 1, Qt.DashLine)
-            p.setPen(pen)
+            p.setPen(self._PEN_TOILET_INNER)
             p.setBrush(Qt.NoBrush)
             p.drawRect(tx + mx, ty + mt, tw - 2 * mx, th - mt - mb)
 
@@ -153,14 +181,14 @@ class OverlayWindow(QWidget):
         j = s.toilet_jorshik
         if j:
             jx, jy = j
-            p.setPen(QPen(QColor(80, 255, 80), 2))
+            p.setPen(self._PEN_JORSHIK)
             p.drawLine(jx - 12, jy, jx + 12, jy)
             p.drawLine(jx, jy - 12, jx, jy + 12)
 
         # Zigzag path — dim lines
         path = s.toilet_path
         if path:
-            p.setPen(QPen(QColor(255, 255, 255, 40), 1))
+            p.setPen(self._PEN_PATH)
             for sx, sy, ex, ey, _dur in path:
                 p.drawLine(sx, sy, ex, ey)
 
@@ -169,9 +197,9 @@ class OverlayWindow(QWidget):
         if cur:
             cx, cy = cur
             p.setPen(Qt.NoPen)
-            p.setBrush(QColor(255, 140, 0))
+            p.setBrush(self._BRUSH_CURSOR)
             p.drawEllipse(cx - 6, cy - 6, 12, 12)
             # Outer ring
-            p.setPen(QPen(QColor(255, 140, 0, 120), 2))
+            p.setPen(self._PEN_CURSOR_RING)
             p.setBrush(Qt.NoBrush)
             p.drawEllipse(cx - 10, cy - 10, 20, 20)
@@ -11,13 +11,16 @@ from ui.stash import fmt_time
 class QueueETAWidget(QWidget):
     _BG     = QColor(255, 255, 255, 10)
     _FILL   = QColor(80, 200, 80, 90)
+    _BORDER_PEN = QPen(COLOR_GREEN, 1)
 
     _BLEND = 0.2
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._progress = 0.0
+        self._last_bw = -1
         self._eta_display = None
+        self._border_rect = QRectF(0.5, 0.5, 0, 0)
 
         lay = QHBoxLayout(self)
         lay.setContentsMargins(7, 1, 7, 1)
@@ -40,11 +43,17 @@ class QueueETAWidget(QWidget):
                 self._eta_display = max(0.0, self._eta_display)
             else:
                 self._eta_display = eta
-            self._time.setText(fmt_time(self._eta_display))
+            text = fmt_time(self._eta_display)
         else:
             self._eta_display = None
-            self._time.setText("")
-        self.update()
+            text = ""
+        if text != self._time.text():
+            self._time.setText(text)
+        # the label repaints itself; only the bar needs this widget redrawn
+        bw = int((self.width() - 2) * self._progress)
+        if bw != self._last_bw:
+            self._last_bw = bw
+            self.update()
 
     def paintEvent(self, _ev):
         p = QPainter(self)
@@ -62,7 +71,8 @@ class QueueETAWidget(QWidget):
             p.drawRoundedRect(1, 1, bw, h - 2, r, r)
 
         p.setBrush(Qt.NoBrush)
-        p.setPen(QPen(COLOR_GREEN, 1))
-        p.drawRoundedRect(QRectF(0.5, 0.5, w - 1, h - 1), r, r)
+        p.setPen(self._BORDER_PEN)
+        self._border_rect.setRect(0.5, 0.5, w - 1, h - 1)
+        p.drawRoundedRect(self._border_rect, r, r)
 
         p.end()
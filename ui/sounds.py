@@ -1,44 +1,72 @@
-"""Click sound system — app-wide event filter."""
+"""Click sound system — per-widget press hooks."""
 
 import os
 
-from PyQt5.QtWidgets import QPushButton, QLineEdit
+from PyQt5.QtWidgets import QAbstractButton
 from PyQt5.QtCore import Qt, QUrl, QObject, QEvent
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QSoundEffect
 
 from utils import resource_path
 
 _SOUND_DIR = resource_path(os.path.join("assets", "sounds"))
 _CLICK_SOUND = os.path.join(_SOUND_DIR, "click.mp3")
-_click_player: QMediaPlayer | None = None
+_CLICK_WAV = os.path.join(_SOUND_DIR, "click.wav")  # PCM copy made by build.py
+_CLICK_URL = QUrl.fromLocalFile(_CLICK_SOUND)
+_CLICK_CONTENT = QMediaContent(_CLICK_URL)
+_POOL_SIZE = 4
+_click_pool: list[QMediaPlayer] = []
+_click_idx = 0
+_click_effect: QSoundEffect | None = None
 
 
 def init_click_sound():
-    global _click_player
-    if _click_player is not None:
+    global _click_effect
+    if _click_effect is not None or _click_pool:
         return
-    _click_player = QMediaPlayer()
-    _click_player.setVolume(70)
+    if os.path.isfile(_CLICK_WAV):
+        # decoded once into memory; play() needs no demux/decoder pipeline
+        _click_effect = QSoundEffect()
+        _click_effect.setSource(QUrl.fromLocalFile(_CLICK_WAV))
+        _click_effect.setVolume(0.7)
+        return
+    for _ in range(_POOL_SIZE):
+        player = QMediaPlayer(None, QMediaPlayer.LowLatency)
+        player.setVolume(70)
+        player.setMedia(_CLICK_CONTENT)
+        _click_pool.append(player)
 
 
 def play_click():
-    if _click_player is None:
+    global _click_idx
+    if _click_effect is None and not _click_pool:
         init_click_sound()
-    _click_player.stop()
-    _click_player.setMedia(QMediaContent(QUrl.fromLocalFile(_CLICK_SOUND)))
-    _click_player.play()
-
-
-_CLICK_TYPES = (QPushButton, QLineEdit)
+    if _click_effect is not None:
+        _click_effect.play()
+        return
+    player = _click_pool[_click_idx]
+    _click_idx = (_click_idx + 1) % _POOL_SIZE
+    player.stop()
+    player.play()
 
 
-class ClickSoundFilter(QObject):
-    """App-wide event filter that plays click sound on interactive widgets."""
+class _PressSoundFilter(QObject):
+    """Plays click sound on left press for widgets without a pressed signal."""
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
-            if isinstance(obj, _CLICK_TYPES):
-                play_click()
-            elif type(obj).__name__ in ("ToggleSwitch", "TitleButton"):
-                play_click()
+            play_click()
         return False
+
+
+_press_filter: _PressSoundFilter | None = None
+
+
+def add_click_sound(widget):
+    """Hook click sound to *widget* (buttons via pressed, others via filter)."""
+    global _press_filter
+    if isinstance(widget, QAbstractButton):
+        widget.pressed.connect(play_click)
+        return
+    if _press_filter is None:
+        _press_filter = _PressSoundFilter()
+    widget.installEventFilter(_press_filter)
@@ -1,16 +1,18 @@
 """Stash timer widgets and schedules."""
 
 import ctypes
-from datetime import datetime, timezone, timedelta
+import time
+from bisect import bisect_right
+from functools import lru_cache
 
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QApplication
-from PyQt5.QtCore import Qt, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtCore import Qt, QRectF, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
 
 from ui.styles import pixel_font, COLOR_RED, COLOR_GREEN
 from ui.widgets import IconWidget
 
-_MSK = timezone(timedelta(hours=3))
+_MSK_OFFSET = 3 * 3600  # UTC+3, no DST
 _DAY = 86400
 
 STASHES = [
@@ -27,57 +29,71 @@ _WS_EX_TRANSPARENT = 0x20
 _WS_EX_TOOLWINDOW = 0x80
 _CLICK_THROUGH    = _WS_EX_LAYERED | _WS_EX_TRANSPARENT | _WS_EX_TOOLWINDOW
 
+_CSS_OPEN   = "color: rgb(80,200,80);"
+_CSS_CLOSED = "color: white;"
 
-def stash_status(hours, open_min, dur_min):
-    now = datetime.now(_MSK)
-    cur = now.hour * 3600 + now.minute * 60 + now.second
 
-    for h in hours:
-        o = h * 3600 + open_min * 60
-        c = o + dur_min * 60
-        if c > _DAY:
-            cw = c - _DAY
-            if cur >= o:
-                return True, (_DAY - cur) + cw
-            if cur < cw:
-                return True, cw - cur
-        elif o <= cur < c:
-            return True, c - cur
+def stash_windows(hours, open_min):
+    """Sorted opening times (seconds since MSK midnight) for a schedule."""
+    return tuple(sorted(h * 3600 + open_min * 60 for h in hours))
 
-    best = None
-    for h in hours:
-        o = h * 3600 + open_min * 60
-        w = o - cur if o > cur else (_DAY - cur) + o
-        if best is None or w < best:
-            best = w
-    return False, best
+
+def msk_day_seconds():
+    """Seconds since Moscow midnight; one reading can be shared by all stashes in a tick."""
+    return (int(time.time()) + _MSK_OFFSET) % _DAY
+
+
+def stash_status(opens, dur_sec, cur=None):
+    """(is_open, seconds until close/open) for precomputed *opens*."""
+    if cur is None:
+        cur = msk_day_seconds()
+
+    i = bisect_right(opens, cur)
+    # latest opening at or before now; before the first one, yesterday's last
+    last = opens[i - 1] if i else opens[-1] - _DAY
+    if cur < last + dur_sec:
+        return True, last + dur_sec - cur
+    nxt = opens[i] if i < len(opens) else opens[0] + _DAY
+    return False, nxt - cur
+
+
+_TWO = [f"{i:02d}" for i in range(60)]
 
 
 def fmt_time(sec):
-    sec = max(0, int(sec))
-    if sec >= 3600:
-        h, r = divmod(sec, 3600)
-        m, s = divmod(r, 60)
-        return f"{h}:{m:02d}:{s:02d}"
+    return _fmt_secs(max(0, int(sec)))
+
+
+@lru_cache(maxsize=1024)
+def _fmt_secs(sec):
     m, s = divmod(sec, 60)
-    return f"{m:02d}:{s:02d}"
+    if m < 60:
+        return f"{_TWO[m]}:{_TWO[s]}"
+    h, m = divmod(m, 60)
+    return f"{h}:{_TWO[m]}:{_TWO[s]}"
 
 
 class StashTimerWidget(QWidget):
     _BG      = QColor(255, 255, 255, 10)
     _FILL_G  = QColor(80, 200, 80, 90)
     _FILL_R  = QColor(200, 70, 70, 90)
+    _BRUSH_BG = QBrush(_BG)
+    _BRUSH_G  = QBrush(_FILL_G)
+    _BRUSH_R  = QBrush(_FILL_R)
+    _PEN_G    = QPen(COLOR_GREEN, 1)
+    _PEN_R    = QPen(COLOR_RED, 1)
+
+    opened = pyqtSignal()  # emitted on the closed -> open transition
 
     def __init__(self, icon_name, hours, open_min, dur_min, parent=None):
         super().__init__(parent)
-        self._hours = hours
-        self._open_min = open_min
-        self._dur = dur_min
+        self._opens = stash_windows(hours, open_min)
         self._is_open = False
         self._progress = 0.0
         self._secs_left = 0
         self._was_open = False
-        self._just_opened = False
+        self._last_text = None
+        self._last_bw = -1
 
         self._open_sec = dur_min * 60
         cycle = (hours[1] - hours[0]) * 3600 if len(hours) >= 2 else _DAY
@@ -104,17 +120,27 @@ class StashTimerWidget(QWidget):
     def is_relevant(self):
         return self._is_open or self._secs_left <= 180
 
-    def refresh(self):
-        is_open, secs = stash_status(self._hours, self._open_min, self._dur)
+    def refresh(self, cur=None) -> bool:
+        """Recompute status at *cur* (msk_day_seconds()); True if text or open state changed."""
+        is_open, secs = stash_status(self._opens, self._open_sec, cur)
         self._secs_left = secs
-        self._time.setText(fmt_time(secs))
-        self._is_open = is_open
+        text = fmt_time(secs)
+        changed = is_open != self._was_open
+        if text != self._last_text:
+            self._last_text = text
+            self._time.setText(text)
+            changed = True
         if is_open and not self._was_open:
-            self._just_opened = True
+            self.opened.emit()
         self._was_open = is_open
         total = self._open_sec if is_open else self._closed_sec
         self._progress = (1.0 - secs / total) if total else 1.0
-        self.update()
+        bw = int((self.width() - 2) * max(0.0, min(1.0, self._progress)))
+        if bw != self._last_bw or is_open != self._is_open:
+            self._last_bw = bw
+            self._is_open = is_open
+            self.update()
+        return changed
 
     def paintEvent(self, _ev):
         p = QPainter(self)
@@ -123,17 +149,16 @@ class StashTimerWidget(QWidget):
         r = 5
 
         p.setPen(Qt.NoPen)
-        p.setBrush(self._BG)
+        p.setBrush(self._BRUSH_BG)
         p.drawRoundedRect(1, 1, w - 2, h - 2, r, r)
 
         bw = int((w - 2) * max(0.0, min(1.0, self._progress)))
         if bw > 0:
-            p.setBrush(self._FILL_G if self._is_open else self._FILL_R)
+            p.setBrush(self._BRUSH_G if self._is_open else self._BRUSH_R)
             p.drawRoundedRect(1, 1, bw, h - 2, r, r)
 
-        color = COLOR_GREEN if self._is_open else COLOR_RED
         p.setBrush(Qt.NoBrush)
-        p.setPen(QPen(color, 1))
+        p.setPen(self._PEN_G if self._is_open else self._PEN_R)
         p.drawRoundedRect(QRectF(0.5, 0.5, w - 1, h - 1), r, r)
 
         p.end()
@@ -162,28 +187,51 @@ class StashFloatWindow(QWidget):
             icon.set_color(QColor(255, 255, 255))
             lbl = QLabel("--:--")
             lbl.setFont(pixel_font(19))
-            lbl.setStyleSheet("color: white;")
+            lbl.setStyleSheet(_CSS_CLOSED)
             lay.addWidget(icon)
             lay.addWidget(lbl)
             icon.hide()
             lbl.hide()
             self._items.append((icon, lbl))
+        self._item_state = [(False, "--:--", False)] * len(STASHES)
+        self._layout_key = None
+
+    def hideEvent(self, ev):
+        self._layout_key = None
+        super().hideEvent(ev)
 
     def update_timers(self, stash_widgets):
-        any_visible = False
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_timers(stash_widgets)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_timers(self, stash_widgets):
         for i, w in enumerate(stash_widgets):
             icon, lbl = self._items[i]
+            visible, text, is_open = self._item_state[i]
             if w.is_relevant:
-                icon.show()
-                lbl.show()
-                lbl.setText(w._time.text())
-                c = "rgb(80,200,80)" if w._is_open else "white"
-                lbl.setStyleSheet(f"color: {c};")
-                any_visible = True
-            else:
+                if not visible:
+                    icon.show()
+                    lbl.show()
+                new_text = w._time.text()
+                if new_text != text:
+                    lbl.setText(new_text)
+                if w._is_open != is_open:
+                    lbl.setStyleSheet(_CSS_OPEN if w._is_open else _CSS_CLOSED)
+                self._item_state[i] = (True, new_text, w._is_open)
+            elif visible:
                 icon.hide()
                 lbl.hide()
-        if any_visible:
+                self._item_state[i] = (False, text, is_open)
+        # proportional font: key on the labels' real widths, not string length
+        layout_key = tuple(lbl.sizeHint().width() if v else -1
+                           for (_, lbl), (v, _, _) in zip(self._items, self._item_state))
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+        if any(n >= 0 for n in layout_key):
             self.adjustSize()
             scr = QApplication.primaryScreen().geometry()
             self.move((scr.width() - self.width()) // 2, 0)
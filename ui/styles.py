@@ -14,9 +14,11 @@ _FONTS = {
     "pixel": os.path.join(_FONT_DIR, "web_ibm_mda.ttf"),
 }
 _font_families: dict[str, str | None] = {"app": None, "pixel": None}
+_font_cache: dict[tuple[str, int], QFont] = {}
 
 
 def load_fonts():
+    """Register bundled fonts (GUI thread) and build the shared stylesheets for them."""
     for key, path in _FONTS.items():
         if os.path.isfile(path) and _font_families[key] is None:
             fid = QFontDatabase.addApplicationFont(path)
@@ -24,13 +26,20 @@ def load_fonts():
                 fams = QFontDatabase.applicationFontFamilies(fid)
                 if fams:
                     _font_families[key] = fams[0]
+                    _font_cache.clear()
+    if _btn_css is None or _styles_family != _font_families["app"]:
+        init_styles()
 
 
 def _make_font(key: str, size: int) -> QFont:
-    family = _font_families.get(key)
-    f = QFont(family) if family else QFont("Consolas" if key == "pixel" else "")
-    f.setPixelSize(size)
-    return f
+    f = _font_cache.get((key, size))
+    if f is None:
+        family = _font_families.get(key)
+        f = QFont(family) if family else QFont("Consolas" if key == "pixel" else "")
+        f.setPixelSize(size)
+        _font_cache[(key, size)] = f
+    # implicitly shared copy: a caller's setBold() etc. must not leak into the cache
+    return QFont(f)
 
 
 def app_font(size: int) -> QFont:
@@ -49,37 +58,63 @@ COLOR_GREEN  = QColor(80, 200, 80)
 
 # ── Cached stylesheets ──
 
+_ff = ""  # font-family fragment for the app font, set by init_styles()
 _btn_css = None
 _input_css = None
+_central_css = None
+_styles_family = None  # app font family the cached sheets were built with
+
+
+def _btn_rules(scope=""):
+    return f"""
+        {scope}QPushButton {{
+            background: rgb(32,32,38); color: rgb(240,240,240);
+            border: 1px solid rgba(255,255,255,20); border-radius: 5px;
+            padding: 5px; font-size: 27px; {_ff}
+        }}
+        {scope}QPushButton:hover {{ background: rgb(44,44,52); }}
+    """
+
+
+def _input_rules(scope=""):
+    return f"""
+        {scope}QLineEdit {{
+            background: rgb(32,32,38); color: rgb(240,240,240);
+            border: 1px solid rgba(255,255,255,20); border-radius: 5px;
+            padding: 3px; font-size: 27px; {_ff}
+        }}
+        {scope}QLineEdit:disabled {{
+            color: rgb(120,120,120); background: rgb(28,28,34);
+        }}
+    """
+
+
+def init_styles():
+    """Build the shared stylesheets for the current app font (load_fonts() calls this)."""
+    global _ff, _btn_css, _input_css, _central_css, _styles_family
+    _styles_family = _font_families["app"]
+    _ff = f"font-family: '{_styles_family}';" if _styles_family else ""
+    _btn_css = _btn_rules()
+    _input_css = _input_rules()
+    # Main window: one sheet on the central "#c" widget styles every
+    # button/input below it via cascade instead of per-widget sheets.
+    _central_css = ("#c{background:rgba(28,28,32,230);}"
+                    + _btn_rules("#c ") + _input_rules("#c "))
+
+
+def central_style():
+    if _central_css is None:
+        load_fonts()
+    return _central_css
 
 
 def button_style():
-    global _btn_css
     if _btn_css is None:
-        ff = f"font-family: '{_font_families['app']}';" if _font_families["app"] else ""
-        _btn_css = f"""
-            QPushButton {{
-                background: rgb(32,32,38); color: rgb(240,240,240);
-                border: 1px solid rgba(255,255,255,20); border-radius: 5px;
-                padding: 5px; font-size: 27px; {ff}
-            }}
-            QPushButton:hover {{ background: rgb(44,44,52); }}
-        """
+        load_fonts()
     return _btn_css
 
 
 def input_style():
-    global _input_css
     if _input_css is None:
-        ff = f"font-family: '{_font_families['app']}';" if _font_families["app"] else ""
-        _input_css = f"""
-            QLineEdit {{
-                background: rgb(32,32,38); color: rgb(240,240,240);
-                border: 1px solid rgba(255,255,255,20); border-radius: 5px;
-                padding: 3px; font-size: 27px; {ff}
-            }}
-            QLineEdit:disabled {{
-                color: rgb(120,120,120); background: rgb(28,28,34);
-            }}
-        """
+        load_fonts()
     return _input_css
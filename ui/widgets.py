@@ -2,25 +2,42 @@ import os
 
 from PyQt5.QtWidgets import QWidget, QPushButton, QHBoxLayout
 from PyQt5.QtCore import Qt, QRectF, pyqtSignal, pyqtProperty, QPropertyAnimation, QPointF
-from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QTransform
+from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QPicture, QTransform
 from PyQt5.QtSvg import QSvgRenderer
 
+from ui.sounds import play_click
 from utils import resource_path
 
 _ICONS_DIR = resource_path(os.path.join("assets", "icons"))
 
-_renderers: dict[str, QSvgRenderer] = {}
 _pixmaps: dict[str, QPixmap] = {}
+_pictures: dict[str, tuple[QPicture, float, float] | None] = {}
+_tinted: dict[tuple[str, int, int, int], QPixmap | None] = {}
 
 
 def _svg(name: str) -> QSvgRenderer | None:
-    if name not in _renderers:
-        path = os.path.join(_ICONS_DIR, f"{name}.svg")
-        if os.path.isfile(path):
-            _renderers[name] = QSvgRenderer(path)
+    """Parse icon SVG; not cached — only needed once to record its QPicture."""
+    path = os.path.join(_ICONS_DIR, f"{name}.svg")
+    if os.path.isfile(path):
+        return QSvgRenderer(path)
+    return None
+
+
+def _svg_picture(name: str) -> tuple[QPicture, float, float] | None:
+    """SVG recorded once into a QPicture at its default size (replay, not re-parse)."""
+    if name not in _pictures:
+        renderer = _svg(name)
+        if renderer and renderer.isValid():
+            size = renderer.defaultSize()
+            dw, dh = max(size.width(), 1), max(size.height(), 1)
+            pic = QPicture()
+            p = QPainter(pic)
+            renderer.render(p, QRectF(0, 0, dw, dh))
+            p.end()
+            _pictures[name] = (pic, dw, dh)
         else:
-            _renderers[name] = None
-    return _renderers[name]
+            _pictures[name] = None
+    return _pictures[name]
 
 
 def _png(name: str) -> QPixmap | None:
@@ -33,6 +50,40 @@ def _png(name: str) -> QPixmap | None:
     return _pixmaps[name]
 
 
+def _tinted_pixmap(name: str, w: int, h: int, color: QColor) -> QPixmap | None:
+    """Rasterize icon *name* at w x h tinted with *color*, cached per appearance."""
+    key = (name, w, h, color.rgba())
+    if key in _tinted:
+        return _tinted[key]
+    pix = None
+    svg = _svg_picture(name)
+    if svg is not None:
+        pic, dw, dh = svg
+        pix = QPixmap(w, h)
+        pix.fill(Qt.transparent)
+        p2 = QPainter(pix)
+        p2.setRenderHint(QPainter.Antialiasing)
+        p2.scale(w / dw, h / dh)
+        p2.drawPicture(0, 0, pic)
+        p2.resetTransform()
+        p2.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        p2.fillRect(0, 0, w, h, color)
+        p2.end()
+    else:
+        src = _png(name)
+        if src and not src.isNull():
+            scaled = src.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pix = QPixmap(w, h)
+            pix.fill(Qt.transparent)
+            p2 = QPainter(pix)
+            p2.drawPixmap((w - scaled.width()) // 2, (h - scaled.height()) // 2, scaled)
+            p2.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            p2.fillRect(0, 0, w, h, color)
+            p2.end()
+    _tinted[key] = pix
+    return pix
+
+
 class IconWidget(QWidget):
     """Draws icons: close, minimize, gta5 (SVG-based with color tint)."""
 
@@ -67,28 +118,9 @@ class IconWidget(QWidget):
 
         else:
             color = self._color or self.ICON_COLOR
-            renderer = _svg(self.icon_type)
-            if renderer and renderer.isValid():
-                pix = QPixmap(w, h)
-                pix.fill(Qt.transparent)
-                p2 = QPainter(pix)
-                renderer.render(p2, QRectF(0, 0, w, h))
-                p2.setCompositionMode(QPainter.CompositionMode_SourceIn)
-                p2.fillRect(0, 0, w, h, color)
-                p2.end()
+            pix = _tinted_pixmap(self.icon_type, w, h, color)
+            if pix is not None:
                 painter.drawPixmap(0, 0, pix)
-            else:
-                src = _png(self.icon_type)
-                if src and not src.isNull():
-                    scaled = src.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    pix = QPixmap(w, h)
-                    pix.fill(Qt.transparent)
-                    p2 = QPainter(pix)
-                    p2.drawPixmap((w - scaled.width()) // 2, (h - scaled.height()) // 2, scaled)
-                    p2.setCompositionMode(QPainter.CompositionMode_SourceIn)
-                    p2.fillRect(0, 0, w, h, color)
-                    p2.end()
-                    painter.drawPixmap(0, 0, pix)
 
         painter.end()
 
@@ -141,15 +173,8 @@ class SpinningIconWidget(IconWidget):
 
         w, h = self.width(), self.height()
         color = self._color or self.ICON_COLOR
-        renderer = _svg(self.icon_type)
-        if renderer and renderer.isValid():
-            pix = QPixmap(w, h)
-            pix.fill(Qt.transparent)
-            p2 = QPainter(pix)
-            renderer.render(p2, QRectF(0, 0, w, h))
-            p2.setCompositionMode(QPainter.CompositionMode_SourceIn)
-            p2.fillRect(0, 0, w, h, color)
-            p2.end()
+        pix = _tinted_pixmap(self.icon_type, w, h, color)
+        if pix is not None:
             painter.drawPixmap(0, 0, pix)
 
         painter.end()
@@ -167,6 +192,7 @@ class TitleButton(QPushButton):
         layout.setContentsMargins(0, 0, 0, 0)
         self._icon = IconWidget(icon_type)
         layout.addWidget(self._icon)
+        self.pressed.connect(play_click)
 
 
 class ToggleSwitch(QWidget):
@@ -175,6 +201,7 @@ class ToggleSwitch(QWidget):
     def __init__(self, parent=None, checked=False):
         super().__init__(parent)
         self._checked = checked
+        self._pix_on = self._pix_off = QPixmap()
         self.setCursor(Qt.PointingHandCursor)
 
     def isChecked(self):
@@ -187,18 +214,33 @@ class ToggleSwitch(QWidget):
             self.toggled.emit(self._checked)
 
     def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            play_click()
         self.setChecked(not self._checked)
 
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._render_states()
+
+    def _render_states(self):
+        self._pix_on = self._render_state(True)
+        self._pix_off = self._render_state(False)
+
+    def _render_state(self, checked):
         w, h = self.width(), self.height()
+        # device pixels, so the antialiased pill stays sharp on scaled displays
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(round(w * dpr), round(h * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.transparent)
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
         pad = 3  # padding between track edge and thumb
 
         # track — full widget area, pill shape
         r = h / 2
         p.setPen(Qt.NoPen)
-        if self._checked:
+        if checked:
             p.setBrush(QColor(80, 200, 80))
         else:
             p.setBrush(QColor(60, 60, 65))
@@ -210,7 +252,7 @@ class ToggleSwitch(QWidget):
         p.setPen(Qt.NoPen)
         thumb_d = h - pad * 2
         thumb_y = pad
-        thumb_x = (w - thumb_d - pad) if self._checked else pad
+        thumb_x = (w - thumb_d - pad) if checked else pad
         # shadow
         p.setBrush(QColor(0, 0, 0, 40))
         p.drawEllipse(QRectF(thumb_x + 0.5, thumb_y + 1, thumb_d, thumb_d))
@@ -219,3 +261,11 @@ class ToggleSwitch(QWidget):
         p.drawEllipse(QRectF(thumb_x, thumb_y, thumb_d, thumb_d))
 
         p.end()
+        return pix
+
+    def paintEvent(self, event):
+        if self._pix_on.devicePixelRatioF() != self.devicePixelRatioF():
+            self._render_states()  # moved to a screen with a different scale
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._pix_on if self._checked else self._pix_off)
+        p.end()
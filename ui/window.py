@@ -3,12 +3,13 @@
 import os
 import sys
 import ctypes
+from ctypes import wintypes
 import logging
-import threading
 import time as _time
 
 import asyncio
 
+import aiohttp
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QApplication, QStackedWidget, QLineEdit, QSlider,
@@ -16,23 +17,52 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 
-from core import is_game_running, get_game_rect
+from core import is_game_running
 from ui.styles import (
     load_fonts, app_font, pixel_font,
     COLOR_RED, COLOR_YELLOW, COLOR_GREEN,
-    button_style, input_style,
+    central_style,
     _font_families,
 )
-from ui.sounds import init_click_sound, play_click, ClickSoundFilter
+from ui.sounds import init_click_sound, play_click, add_click_sound
 from ui.widgets import IconWidget, SpinningIconWidget, TitleButton, ToggleSwitch
 from ui.overlay import OverlayWindow
-from ui.stash import STASHES, StashTimerWidget, StashFloatWindow
+from ui.stash import STASHES, StashTimerWidget, StashFloatWindow, msk_day_seconds
 from ui.queue import QueueETAWidget
 from ui.footer import FooterBar
 from ui.items import ItemsWindow
 
 log = logging.getLogger(__name__)
 
+_user32 = ctypes.windll.user32
+_WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+_user32.EnumWindows.argtypes = [_WNDENUMPROC, wintypes.LPARAM]
+_SW_MINIMIZE = 6
+
+# slider labels for the prediction-time range (0..250 ms), built once
+_MS_TEXT = tuple(f"{v} мс" for v in range(251))
+
+
+def _ms_text(ms):
+    return _MS_TEXT[ms] if 0 <= ms < len(_MS_TEXT) else f"{ms} мс"
+
+
+# coordinates page labels: preformatted templates, "—" when no reading
+_MARKER_KEYS = ("X", "Y", "Z", "Heading")
+_MARKER_FMT = (
+    "X  {:.1f}".format,
+    "Y  {:.1f}".format,
+    "Z  {:.1f}".format,
+    "Heading  {:.1f}\u00b0".format,
+)
+_MARKER_EMPTY = tuple(f"{k}  \u2014" for k in _MARKER_KEYS)
+
+
+def _set_text(label, text):
+    """setText only when the shown text differs (ticks mostly repeat it)."""
+    if label.text() != text:
+        label.setText(text)
+
 
 class MainWindow(QMainWindow):
     _sig_update_progress = pyqtSignal(float, str)
@@ -56,9 +86,12 @@ class MainWindow(QMainWindow):
         self.setFixedSize(self._w, self._h - btn_row * 3 + footer_h)
         self.move(scr.width() - self._w, 0)
 
+        # build everything with painting frozen; one layout/polish pass at the end
+        self.setUpdatesEnabled(False)
+
         central = QWidget()
         central.setObjectName("c")
-        central.setStyleSheet("#c{background:rgba(28,28,32,230);}")
+        central.setStyleSheet(central_style())
         self.setCentralWidget(central)
 
         root = QVBoxLayout(central)
@@ -66,48 +99,81 @@ class MainWindow(QMainWindow):
         root.setSpacing(0)
         root.addWidget(self._build_title_bar())
 
+        # slider drags fire per step; persist only the settled value
+        self._pending_pred_ms = None
+        self._save_pred_timer = QTimer(self)
+        self._save_pred_timer.setSingleShot(True)
+        self._save_pred_timer.setInterval(300)
+        self._save_pred_timer.timeout.connect(self._flush_pred_time)
+        state.fishing2_pred_time = self._load_pred_time() / 1000.0
+
         self._stack = QStackedWidget()
         root.addWidget(self._stack, 1)
-        self._stack.addWidget(self._build_menu_page())      # 0
-        self._stack.addWidget(self._build_queue_page())      # 1
-        self._stack.addWidget(self._build_helper_page())     # 2
-        self._stack.addWidget(self._build_stash_page())      # 3
-        self._stack.addWidget(self._build_bots_page())       # 4
-        self._stack.addWidget(self._build_fishing2_page())   # 5
-        self._stack.addWidget(self._build_settings_page())   # 6
-        self._stack.addWidget(self._build_markers_page())    # 7
-        self._stack.addWidget(self._build_toilet_page())    # 8
+        # pages other than the menu are built on first _go_to()
+        self._page_builders = [
+            None,                        # 0 menu (eager)
+            self._build_queue_page,      # 1
+            self._build_helper_page,     # 2
+            self._build_stash_page,      # 3
+            self._build_bots_page,       # 4
+            self._build_fishing2_page,   # 5
+            self._build_settings_page,   # 6
+            self._build_markers_page,    # 7
+            self._build_toilet_page,     # 8
+        ]
+        self._stack.addWidget(self._build_menu_page())
+        for _ in self._page_builders[1:]:
+            self._stack.addWidget(QWidget())
 
         root.addWidget(self._build_footer())
+        self.setUpdatesEnabled(True)
 
         self._ui_locked = True
         self._stack.setEnabled(False)
 
         self._overlay = OverlayWindow(state)
         self._stash_float = StashFloatWindow()
+        self._stash_float_dirty = True
 
         self._fish2_timer = QTimer(self)
         self._fish2_timer.timeout.connect(self._on_fish2_tick)
+        self._fish2_status_key = None
 
         self._toilet_timer = QTimer(self)
         self._toilet_timer.timeout.connect(self._on_toilet_tick)
 
         self._game_found = False
         self._drag_pos = None
+        self._enum_keep = set()
+        self._enum_proc = _WNDENUMPROC(self._enum_minimize)
 
         self._update_game_status()
 
-        init_click_sound()
-        self._click_filter = ClickSoundFilter(self)
-        QApplication.instance().installEventFilter(self._click_filter)
+        # build the click player after the first paint; an earlier click inits it lazily
+        QTimer.singleShot(2000, init_click_sound)
+
+        self._game_timer = QTimer(self)
+        self._game_timer.timeout.connect(self._update_game_status)
+        self._game_timer.start(1000)
 
-        t = QTimer(self)
-        t.timeout.connect(self._on_tick)
-        t.start(1000)
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.timeout.connect(self._on_overlay_tick)
+        self._overlay_timer.start(1000)
+
+        # page/feature-scoped timers, started and stopped by _sync_timers();
+        # queue and stash share one 1 s clock so they wake together
+        self._queue_live = False
+        self._stash_live = False
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setInterval(1000)
+        self._clock_timer.timeout.connect(self._on_clock_tick)
 
         self._markers_timer = QTimer(self)
+        self._markers_timer.setInterval(50)
         self._markers_timer.timeout.connect(self._update_markers)
-        self._markers_timer.start(50)
+
+        self._stack.currentChanged.connect(self._sync_timers)
+        self._sync_timers()
 
         self._sig_update_progress.connect(self._on_update_progress)
         self._sig_update_result.connect(self._on_update_result)
@@ -117,7 +183,8 @@ class MainWindow(QMainWindow):
 
     def _build_title_bar(self):
         bar = QWidget()
-        bar.setStyleSheet("background:transparent;")
+        bar.setObjectName("bar")
+        bar.setStyleSheet("#bar{background:transparent;}")
         bs = max(self._h // 12, 12)
         bar.setFixedHeight(bs + 4)
         side_w = bs * 2 + 4
@@ -134,8 +201,8 @@ class MainWindow(QMainWindow):
         self._btn_back = QPushButton("<")
         self._btn_back.setCursor(Qt.PointingHandCursor)
         self._btn_back.setFixedSize(bs, bs)
-        self._btn_back.setStyleSheet(button_style())
         self._btn_back.clicked.connect(self._go_back)
+        add_click_sound(self._btn_back)
         self._btn_back.hide()
         ll.addWidget(self._btn_back)
         ll.addStretch()
@@ -209,47 +276,52 @@ class MainWindow(QMainWindow):
     # ── Update check ──
 
     def _start_update_check(self):
+        loop = self._state.loop
+        if loop is None:
+            # asyncio thread still starting up
+            QTimer.singleShot(100, self._start_update_check)
+            return
         self._update_icon.set_color(COLOR_YELLOW)
         self._update_icon.start_spin()
         self._footer.set_progress(0.0)
         self._update_status.setText("проверка...")
-        t = threading.Thread(target=self._update_worker, daemon=True)
-        t.start()
-
-    def _update_worker(self):
-        from updater import check_update_sync, download_update_sync
-
-        try:
-            info = check_update_sync()
-        except Exception:
-            self._sig_update_result.emit("no_server")
-            return
-
-        if info is None:
-            self._sig_update_progress.emit(1.0, "")
-            self._sig_update_result.emit("ok")
-            return
-
-        url = info.get("download_url", "")
-        if not url:
-            self._sig_update_progress.emit(1.0, "")
-            self._sig_update_result.emit("ok")
-            return
-
-        if not getattr(sys, 'frozen', False):
-            self._sig_update_progress.emit(1.0, "dev mode")
-            self._sig_update_result.emit("ok")
-            return
-
-        version = info.get("version", "?")
-        self._sig_update_progress.emit(0.0, f"загрузка {version}...")
-        dest = os.path.join(os.path.dirname(sys.executable), "Mary Jane_update.exe")
-
-        def on_progress(pct):
-            p = int(pct * 100)
-            self._sig_update_progress.emit(pct, f"{p}%")
-
-        ok = download_update_sync(url, dest, on_progress)
+        asyncio.run_coroutine_threadsafe(self._update_coro(), loop)
+
+    async def _update_coro(self):
+        from updater import check_update, download_update
+
+        async with aiohttp.ClientSession() as session:
+            try:
+                info = await check_update(session)
+            except Exception:
+                self._sig_update_result.emit("no_server")
+                return
+
+            if info is None:
+                self._sig_update_progress.emit(1.0, "")
+                self._sig_update_result.emit("ok")
+                return
+
+            url = info.get("download_url", "")
+            if not url:
+                self._sig_update_progress.emit(1.0, "")
+                self._sig_update_result.emit("ok")
+                return
+
+            if not getattr(sys, 'frozen', False):
+                self._sig_update_progress.emit(1.0, "dev mode")
+                self._sig_update_result.emit("ok")
+                return
+
+            version = info.get("version", "?")
+            self._sig_update_progress.emit(0.0, f"загрузка {version}...")
+            dest = os.path.join(os.path.dirname(sys.executable), "Mary Jane_update.exe")
+
+            def on_progress(pct):
+                p = int(pct * 100)
+                self._sig_update_progress.emit(pct, f"{p}%")
+
+            ok = await download_update(session, url, dest, on_progress)
         if ok:
             self._sig_update_progress.emit(1.0, "перезапуск...")
             self._sig_update_result.emit("apply:" + dest)
@@ -258,7 +330,7 @@ class MainWindow(QMainWindow):
 
     def _on_update_progress(self, value, text):
         self._footer.set_progress(value)
-        self._update_status.setText(text)
+        _set_text(self._update_status, text)
 
     def _on_update_result(self, result):
         self._update_icon.stop_spin()
@@ -287,7 +359,20 @@ class MainWindow(QMainWindow):
 
     # ── Navigation ──
 
+    def _ensure_page(self, idx):
+        builder = self._page_builders[idx]
+        if builder is None:
+            return
+        self._page_builders[idx] = None
+        placeholder = self._stack.widget(idx)
+        self._stack.setUpdatesEnabled(False)
+        self._stack.insertWidget(idx, builder())
+        self._stack.removeWidget(placeholder)
+        self._stack.setUpdatesEnabled(True)
+        placeholder.deleteLater()
+
     def _go_to(self, idx):
+        self._ensure_page(idx)
         prev = self._stack.currentIndex()
         self._stack.setCurrentIndex(idx)
         self._btn_back.setVisible(idx != 0)
@@ -350,8 +435,8 @@ class MainWindow(QMainWindow):
                            ("Настройки", lambda: self._go_to(6))]:
             b = QPushButton(text)
             b.setCursor(Qt.PointingHandCursor)
-            b.setStyleSheet(button_style())
             b.clicked.connect(slot)
+            add_click_sound(b)
             lay.addWidget(b)
         lay.addStretch()
         return page
@@ -363,6 +448,7 @@ class MainWindow(QMainWindow):
         lay.setSpacing(5)
 
         self._queue_label = QLabel("\u2014")
+        self._last_queue_pos = None
         self._queue_label.setAlignment(Qt.AlignCenter)
         self._queue_label.setStyleSheet("color:rgb(220,220,220);")
         self._queue_label.setFont(app_font(self._h // 3))
@@ -385,8 +471,8 @@ class MainWindow(QMainWindow):
         self._threshold_input = QLineEdit("30")
         self._threshold_input.setFixedWidth(65)
         self._threshold_input.setAlignment(Qt.AlignCenter)
-        self._threshold_input.setStyleSheet(input_style())
         self._threshold_input.textChanged.connect(self._on_threshold_changed)
+        add_click_sound(self._threshold_input)
         rl.addWidget(self._threshold_input)
 
         lay.addWidget(row)
@@ -406,15 +492,16 @@ class MainWindow(QMainWindow):
         ]
 
         container = QWidget()
-        container.setStyleSheet("background: transparent;")
+        container.setObjectName("helpers")
+        container.setStyleSheet("#helpers{background: transparent;}")
         cl = QVBoxLayout(container)
         cl.setContentsMargins(7, 5, 7, 5)
         cl.setSpacing(5)
         for text, slot in buttons:
             b = QPushButton(text)
             b.setCursor(Qt.PointingHandCursor)
-            b.setStyleSheet(button_style())
             b.clicked.connect(slot)
+            add_click_sound(b)
             cl.addWidget(b)
         cl.addStretch()
 
@@ -448,6 +535,7 @@ class MainWindow(QMainWindow):
         self._stash_widgets = []
         for name, hours, om, dur in STASHES:
             w = StashTimerWidget(name, hours, om, dur)
+            w.opened.connect(self._on_stash_opened)
             self._stash_widgets.append(w)
             lay.addWidget(w, 1)
         return page
@@ -458,7 +546,8 @@ class MainWindow(QMainWindow):
         lay.setContentsMargins(12, 8, 12, 5)
         lay.setSpacing(0)
 
-        self._marker_labels = {}
+        labels = {}
+        self._last_marker_vals = (None,) * len(_MARKER_KEYS)  # labels start as "—"
         lbl_style = "color:rgb(200,200,200); background:transparent; border:none;"
 
         def make_group(keys, font_size=16):
@@ -471,7 +560,7 @@ class MainWindow(QMainWindow):
                 lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
                 lbl.setFont(pixel_font(font_size))
                 lbl.setStyleSheet(lbl_style)
-                self._marker_labels[key] = lbl
+                labels[key] = lbl
                 gl.addWidget(lbl)
             return group
 
@@ -489,6 +578,10 @@ class MainWindow(QMainWindow):
         # Body heading
         lay.addWidget(make_group(["Heading"], 14))
 
+        # (label, template, empty text) in _MARKER_KEYS order, walked by _update_markers
+        self._marker_slots = tuple(zip((labels[k] for k in _MARKER_KEYS),
+                                       _MARKER_FMT, _MARKER_EMPTY))
+        self._marker_page = page
         lay.addStretch()
         return page
 
@@ -501,8 +594,8 @@ class MainWindow(QMainWindow):
         for text, page_idx in [("Рыбалка", 5), ("Туалет", 8)]:
             b = QPushButton(text)
             b.setCursor(Qt.PointingHandCursor)
-            b.setStyleSheet(button_style())
             b.clicked.connect(lambda _=False, p=page_idx: self._go_to(p))
+            add_click_sound(b)
             lay.addWidget(b)
 
         lay.addStretch()
@@ -544,20 +637,20 @@ class MainWindow(QMainWindow):
                 border-radius: 7px;
             }
         """)
-        self._fish2_slider.valueChanged.connect(self._on_fish2_slider)
         dl.addWidget(self._fish2_slider)
 
-        saved_ms = self._load_pred_time()
+        saved_ms = round(self._state.fishing2_pred_time * 1000)
         self._fish2_slider.setValue(saved_ms)
-        self._state.fishing2_pred_time = saved_ms / 1000.0
+        self._fish2_slider_label.setText(_ms_text(saved_ms))
+        self._fish2_slider.valueChanged.connect(self._on_fish2_slider)
 
         self._fish2_debug_panel.hide()
         lay.addWidget(self._fish2_debug_panel)
 
         self._fish2_btn = QPushButton("Старт")
         self._fish2_btn.setCursor(Qt.PointingHandCursor)
-        self._fish2_btn.setStyleSheet(button_style())
         self._fish2_btn.clicked.connect(self._toggle_fishing2)
+        add_click_sound(self._fish2_btn)
         lay.addWidget(self._fish2_btn)
         return page
 
@@ -575,8 +668,8 @@ class MainWindow(QMainWindow):
 
         self._toilet_btn = QPushButton("Старт")
         self._toilet_btn.setCursor(Qt.PointingHandCursor)
-        self._toilet_btn.setStyleSheet(button_style())
         self._toilet_btn.clicked.connect(self._toggle_toilet)
+        add_click_sound(self._toilet_btn)
         lay.addWidget(self._toilet_btn)
         return page
 
@@ -612,26 +705,27 @@ class MainWindow(QMainWindow):
             self._toilet_status.setText("Поиск...")
             self._toilet_timer.start(33)
 
+    _TOILET_STEP_TEXT = {"search": "Поиск...", "scrub": "Чистим!", "done": "Готово"}
+
     def _on_toilet_tick(self):
-        s = self._state
-        step = s.toilet_step
-        if step == "search":
-            self._toilet_status.setText("Поиск...")
-        elif step == "scrub":
-            self._toilet_status.setText("Чистим!")
-        elif step == "done":
-            self._toilet_status.setText("Готово")
+        text = self._TOILET_STEP_TEXT.get(self._state.toilet_step)
+        if text is not None:
+            _set_text(self._toilet_status, text)
         self._overlay.sync()
 
     def _on_fish2_slider(self, val):
-        self._fish2_slider_label.setText(f"{val} мс")
+        self._fish2_slider_label.setText(_ms_text(val))
         self._state.fishing2_pred_time = val / 1000.0
-        self._save_pred_time(val)
+        self._pending_pred_ms = val
+        self._save_pred_timer.start()
 
-    def _save_pred_time(self, ms):
+    def _flush_pred_time(self):
+        if self._pending_pred_ms is None:
+            return
         from licensing import _load_config, _save_config
         data = _load_config()
-        data["fishing_pred_ms"] = ms
+        data["fishing_pred_ms"] = self._pending_pred_ms
+        self._pending_pred_ms = None
         _save_config(data)
 
     def _load_pred_time(self):
@@ -646,8 +740,8 @@ class MainWindow(QMainWindow):
         lay.setSpacing(5)
         btn = QPushButton("Сброс")
         btn.setCursor(Qt.PointingHandCursor)
-        btn.setStyleSheet(button_style())
         btn.clicked.connect(self._reset_settings)
+        add_click_sound(btn)
         lay.addWidget(btn)
         lay.addStretch()
         return page
@@ -664,7 +758,8 @@ class MainWindow(QMainWindow):
         s.fishing2_bar_rect = None
         s.fishing2_debug = False
         s.fishing2_calibrated = False
-        self._fish2_slider.setValue(120)
+        if hasattr(self, "_fish2_slider"):
+            self._fish2_slider.setValue(120)
         self._go_to(0)
 
     def _toggle_fishing2(self):
@@ -708,66 +803,73 @@ class MainWindow(QMainWindow):
         else:
             self._fish2_cd_timer.stop()
             self._state.fishing2_active = True
+            self._fish2_status_key = None
             if self._state.fishing2_debug:
                 self._fish2_status.setText("Калибровка")
             else:
                 self._fish2_status.setText("Заброс")
             self._fish2_timer.start(33)
 
+    _REEL_TXT = {"left": "\u2190\nВытягивание", "right": "\u2192\nВытягивание"}
+
+    def _fish2_cast_text(self, s):
+        return "Калибровка" if s.fishing2_debug else "Заброс"
+
+    def _fish2_strike_text(self, s):
+        return "Подсечка (пузыри!)" if s.fishing2_bubbles else "Подсечка"
+
+    def _fish2_reel_text(self, s):
+        return self._REEL_TXT.get(s.fishing2_camera_dir, "Вытягивание")
+
+    def _fish2_end_text(self, s):
+        remaining = s.fishing2_take_pause - _time.monotonic()
+        return f"Пауза {remaining:.1f}с" if remaining > 0 else "Забрать"
+
+    _FISH2_STEP_TEXT = {
+        "idle": _fish2_cast_text,
+        "cast": _fish2_cast_text,
+        "strike": _fish2_strike_text,
+        "reel": _fish2_reel_text,
+        "end": _fish2_end_text,
+    }
+
     def _on_fish2_tick(self):
         s = self._state
         step = s.fishing2_step
-        if step in ("idle", "cast"):
-            if s.fishing2_debug:
-                self._fish2_status.setText("Калибровка")
-            else:
-                self._fish2_status.setText("Заброс")
-        elif step == "strike":
-            txt = "Подсечка (пузыри!)" if s.fishing2_bubbles else "Подсечка"
-            self._fish2_status.setText(txt)
-        elif step == "reel":
-            d = s.fishing2_camera_dir
-            if d == "left":
-                self._fish2_status.setText("\u2190\nВытягивание")
-            elif d == "right":
-                self._fish2_status.setText("\u2192\nВытягивание")
-            else:
-                self._fish2_status.setText("Вытягивание")
-        elif step == "end":
-            remaining = s.fishing2_take_pause - _time.monotonic()
-            if remaining > 0:
-                self._fish2_status.setText(f"Пауза {remaining:.1f}с")
-            else:
-                self._fish2_status.setText("Забрать")
+        # the label only depends on these; the 33 ms tick is for the overlay
+        key = (step, s.fishing2_debug, s.fishing2_bubbles, s.fishing2_camera_dir,
+               round(max(0.0, s.fishing2_take_pause - _time.monotonic()), 1)
+               if step == "end" else None)
+        if key != self._fish2_status_key:
+            self._fish2_status_key = key
+            handler = self._FISH2_STEP_TEXT.get(step)
+            if handler is not None:
+                _set_text(self._fish2_status, handler(self, s))
         self._overlay.sync()
 
     # ── Callbacks ──
 
     def _focus_game(self):
         from core import GAME_WINDOW_TITLE
-        game_hwnd = ctypes.windll.user32.FindWindowW(None, GAME_WINDOW_TITLE)
+        game_hwnd = _user32.FindWindowW(None, GAME_WINDOW_TITLE)
         if not game_hwnd:
             return
         our_hwnd = int(self.winId())
         overlay_hwnd = int(self._overlay.winId()) if self._overlay else 0
 
-        SW_MINIMIZE = 6
-        keep = {game_hwnd, our_hwnd, overlay_hwnd}
-
-        def _enum_cb(hwnd, _):
-            if hwnd in keep:
-                return True
-            if not ctypes.windll.user32.IsWindowVisible(hwnd):
-                return True
-            length = ctypes.windll.user32.GetWindowTextLengthW(hwnd)
-            if length == 0:
-                return True
-            ctypes.windll.user32.ShowWindow(hwnd, SW_MINIMIZE)
-            return True
+        self._enum_keep = {game_hwnd, our_hwnd, overlay_hwnd}
+        _user32.EnumWindows(self._enum_proc, 0)
+        _user32.SetForegroundWindow(game_hwnd)
 
-        WNDENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.c_int, ctypes.POINTER(ctypes.c_int))
-        ctypes.windll.user32.EnumWindows(WNDENUMPROC(_enum_cb), 0)
-        ctypes.windll.user32.SetForegroundWindow(game_hwnd)
+    def _enum_minimize(self, hwnd, _):
+        if hwnd in self._enum_keep:
+            return True
+        if not _user32.IsWindowVisible(hwnd):
+            return True
+        if _user32.GetWindowTextLengthW(hwnd) == 0:
+            return True
+        _user32.ShowWindow(hwnd, _SW_MINIMIZE)
+        return True
 
     def _parse_threshold(self, text):
         t = text.strip()
@@ -784,6 +886,10 @@ class MainWindow(QMainWindow):
 
     def _on_stash_toggle(self, checked):
         self._state.stash_active = checked
+        self._stash_float_dirty = True
+        if not checked and self._stash_float.isVisible():
+            self._stash_float.hide()
+        self._sync_timers()
 
     def _on_threshold_changed(self, text):
         self._state.notify_threshold = self._parse_threshold(text)
@@ -805,26 +911,66 @@ class MainWindow(QMainWindow):
         self._items_window.activateWindow()
         self._items_window.load_items()
 
-    # ── Tick (1 s) ──
+    # ── Ticks ──
+
+    def _sync_timers(self, _idx=None):
+        """Run page-scoped timers only while their page or feature is live."""
+        idx = self._stack.currentIndex()
+        queue_live = idx == 1
+        stash_live = idx == 3 or self._state.stash_active
+        # refresh right away on becoming live, not on the next shared tick
+        if queue_live and not self._queue_live:
+            self._on_queue_tick()
+        if stash_live and not self._stash_live:
+            self._on_stash_tick()
+        self._queue_live = queue_live
+        self._stash_live = stash_live
+        for timer, live, slot in (
+            (self._clock_timer, queue_live or stash_live, None),
+            (self._markers_timer, idx == 7, self._update_markers),
+        ):
+            if live and not timer.isActive():
+                timer.start()
+                if slot is not None:
+                    slot()
+            elif not live and timer.isActive():
+                timer.stop()
+
+    def _on_clock_tick(self):
+        if self._queue_live:
+            self._on_queue_tick()
+        if self._stash_live:
+            self._on_stash_tick()
+
+    def _on_queue_tick(self):
+        state = self._state
+        pos = state.queue_position
+        if pos != self._last_queue_pos:
+            self._last_queue_pos = pos
+            if pos is None:
+                self._queue_label.setText("\u2014")
+            else:
+                self._queue_label.setNum(pos)
+        self._queue_eta.refresh(state)
 
-    def _on_tick(self):
-        self._update_game_status()
-        pos = self._state.queue_position
-        self._queue_label.setText(str(pos) if pos is not None else "\u2014")
-        self._queue_eta.refresh(self._state)
+    def _on_stash_tick(self):
+        dirty = self._stash_float_dirty
+        cur = msk_day_seconds()  # same clock reading for every row
         for w in self._stash_widgets:
-            w.refresh()
-        if self._state.stash_active:
-            for w in self._stash_widgets:
-                if w._just_opened:
-                    play_click()
-                    w._just_opened = False
+            dirty |= w.refresh(cur)
+        # toggling stash off hides the float in _on_stash_toggle
+        if dirty and self._state.stash_active:
+            self._stash_float_dirty = False
             self._stash_float.update_timers(self._stash_widgets)
-        else:
-            if self._stash_float.isVisible():
-                self._stash_float.hide()
-        self._overlay.sync()
-        self._update_markers()
+
+    def _on_stash_opened(self):
+        if self._state.stash_active:
+            play_click()
+
+    def _on_overlay_tick(self):
+        # bot ticks already sync at 33 ms; this only catches hide-after-stop
+        if not (self._fish2_timer.isActive() or self._toilet_timer.isActive()):
+            self._overlay.sync()
 
     def _update_markers(self):
         if not self._state.markers_active:
@@ -833,18 +979,22 @@ class MainWindow(QMainWindow):
         s = self._state
         p = s.markers_pos
         heading = s.markers_yaw
-
-        if p:
-            self._marker_labels["X"].setText(f"X  {p[0]:.1f}")
-            self._marker_labels["Y"].setText(f"Y  {p[1]:.1f}")
-            self._marker_labels["Z"].setText(f"Z  {p[2]:.1f}")
-        else:
-            for k in ("X", "Y", "Z"):
-                self._marker_labels[k].setText(f"{k}  \u2014")
-
-        self._marker_labels["Heading"].setText(
-            f"Heading  {heading:.1f}\u00b0" if heading is not None else "Heading  \u2014"
-        )
+        # labels show 0.1 precision; only re-format the ones whose value moved
+        vals = (round(p[0], 1), round(p[1], 1), round(p[2], 1)) if p else (None, None, None)
+        vals += (None if heading is None else round(heading, 1),)
+        last = self._last_marker_vals
+        if vals == last:
+            return
+        self._last_marker_vals = vals
+        # several labels usually move together; repaint the page once
+        page = self._marker_page
+        page.setUpdatesEnabled(False)
+        try:
+            for (lbl, fmt, empty), v, old in zip(self._marker_slots, vals, last):
+                if v != old:
+                    lbl.setText(empty if v is None else fmt(v))
+        finally:
+            page.setUpdatesEnabled(True)
 
     def _update_game_status(self):
         found = is_game_running()
@@ -856,18 +1006,21 @@ class MainWindow(QMainWindow):
 
     def mousePressEvent(self, ev):
         if ev.button() == Qt.LeftButton:
-            self._drag_pos = ev.globalPos() - self.frameGeometry().topLeft()
+            # plain-int offset from the window's top-left (x()/y() include the frame)
+            self._drag_pos = (ev.globalX() - self.x(), ev.globalY() - self.y())
             ev.accept()
 
     def mouseMoveEvent(self, ev):
-        if self._drag_pos and ev.buttons() == Qt.LeftButton:
-            self.move(ev.globalPos() - self._drag_pos)
+        if self._drag_pos is not None and ev.buttons() == Qt.LeftButton:
+            dx, dy = self._drag_pos
+            self.move(ev.globalX() - dx, ev.globalY() - dy)
             ev.accept()
 
     def mouseReleaseEvent(self, _ev):
         self._drag_pos = None
 
     def closeEvent(self, ev):
+        self._flush_pred_time()
         self._overlay.close()
         self._stash_float.close()
         if hasattr(self, "_items_window") and self._items_window is not None:
@@ -880,6 +1033,11 @@ class MainWindow(QMainWindow):
             s.frame_provider.stop()
         if s.loop and s.loop.is_running():
             if s.supabase:
-                asyncio.run_coroutine_threadsafe(s.supabase.close(), s.loop)
+                # let the session close before the loop stops under it
+                fut = asyncio.run_coroutine_threadsafe(s.supabase.close(), s.loop)
+                try:
+                    fut.result(timeout=1.0)
+                except Exception:
+                    log.debug("Supabase close did not finish", exc_info=True)
             s.loop.call_soon_threadsafe(s.loop.stop)
         super().closeEvent(ev)
@@ -3,10 +3,11 @@
 import os
 import sys
 import json
+import asyncio
 import logging
 import subprocess
-import urllib.request
-import urllib.error
+
+import aiohttp
 
 from version import __version__
 
@@ -14,6 +15,7 @@ log = logging.getLogger(__name__)
 
 GITHUB_REPO = "mk-amorson/mary-jane"
 GITHUB_TOKEN = ""  # Fine-grained read-only token for private repo
+_WRITE_BUF = 1024 * 1024
 
 
 def _parse_version(v: str) -> tuple[int, ...]:
@@ -28,16 +30,20 @@ def is_newer(remote: str, local: str) -> bool:
     return _parse_version(remote) > _parse_version(local)
 
 
-def check_update_sync() -> dict | None:
-    """Check GitHub Releases for newer version. Returns dict or None."""
-    url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-    headers = {"Accept": "application/vnd.github+json"}
+def _headers(accept: str) -> dict:
+    headers = {"Accept": accept}
     if GITHUB_TOKEN:
         headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+    return headers
 
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=5) as resp:
-        data = json.loads(resp.read())
+
+async def check_update(session: aiohttp.ClientSession) -> dict | None:
+    """Check GitHub Releases for newer version. Returns dict or None."""
+    url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+    async with session.get(url, headers=_headers("application/vnd.github+json"),
+                           timeout=aiohttp.ClientTimeout(total=5)) as resp:
+        resp.raise_for_status()
+        data = json.loads(await resp.read())
 
     remote_ver = data.get("tag_name", "").lstrip("v")
     if not remote_ver or not is_newer(remote_ver, __version__):
@@ -56,26 +62,34 @@ def check_update_sync() -> dict | None:
     return None
 
 
-def download_update_sync(url: str, dest: str, progress_cb=None) -> bool:
+async def download_update(session: aiohttp.ClientSession, url: str, dest: str,
+                          progress_cb=None) -> bool:
     """Download release asset from GitHub (private repo needs auth)."""
     try:
-        headers = {"Accept": "application/octet-stream"}
-        if GITHUB_TOKEN:
-            headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
-
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=30) as resp:
+        timeout = aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+        async with session.get(url, headers=_headers("application/octet-stream"),
+                               timeout=timeout) as resp:
+            resp.raise_for_status()
             total = int(resp.headers.get("Content-Length", 0))
             downloaded = 0
-            with open(dest, 'wb') as f:
-                while True:
-                    chunk = resp.read(64 * 1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
+            # disk I/O runs in the default executor so the shared loop never blocks on it;
+            # chunks are buffered to ~1 MiB to keep executor hops few
+            loop = asyncio.get_running_loop()
+            f = await loop.run_in_executor(None, open, dest, 'wb')
+            try:
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    buf += chunk
                     downloaded += len(chunk)
+                    if len(buf) >= _WRITE_BUF:
+                        await loop.run_in_executor(None, f.write, bytes(buf))
+                        buf.clear()
                     if progress_cb and total > 0:
                         progress_cb(downloaded / total)
+                if buf:
+                    await loop.run_in_executor(None, f.write, bytes(buf))
+            finally:
+                await loop.run_in_executor(None, f.close)
         log.info("Downloaded update to %s (%d bytes)", dest, downloaded)
         return True
     except Exception: